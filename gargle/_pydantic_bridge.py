@@ -0,0 +1,52 @@
+# pyright: reportPrivateUsage=false
+"""Pydantic validation hooks for the maybe classes.
+
+Only imported by `gargle.maybe` when pydantic is installed.
+"""
+
+from __future__ import annotations
+
+import typing as t
+
+from pydantic import ValidationError
+
+if t.TYPE_CHECKING:
+    from pydantic.fields import ModelField
+
+    from gargle.maybe import Maybe
+
+
+def _get_validators(
+    cls: type[t.Any],
+) -> t.Iterable[t.Callable[[t.Any, t.Any], Maybe[t.Any]]]:
+    """Yields validator for pydantic."""
+    yield cls._pydantic_validate
+
+
+def _pydantic_validate(
+    cls: type[t.Any], value: t.Any, field: ModelField
+) -> Maybe[t.Any]:
+    from gargle import maybe
+
+    value = maybe.as_maybe_flat(value)
+
+    if not field.sub_fields or value.is_nothing():
+        return value
+
+    sub_field = field.sub_fields[0]
+    valid_value, error = sub_field.validate(value._value, {}, loc="maybe_value")
+    if error:
+        # quick hack to avoid raising 2 validation errors
+        # the validation will be called for both class of the `Maybe` union
+        # (`Some` and `Nothing`) and we want to raise only one error
+        errors = [error] if field.type_ is maybe.Some else []
+
+        raise ValidationError(errors, cls)
+
+    return maybe.as_maybe(valid_value)
+
+
+def attach(cls: type[t.Any]) -> None:
+    """Adds the pydantic validation hooks to `cls`."""
+    cls.__get_validators__ = classmethod(_get_validators)
+    cls._pydantic_validate = classmethod(_pydantic_validate)
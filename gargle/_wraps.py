@@ -0,0 +1,32 @@
+"""Decorator helpers shared by `gargle.maybe` and `gargle.result`."""
+
+from __future__ import annotations
+
+import typing as t
+
+WrapperT = t.TypeVar("WrapperT", bound=t.Callable[..., t.Any])
+
+WRAPPER_ASSIGNMENTS = (
+    "__module__",
+    "__name__",
+    "__qualname__",
+    "__doc__",
+    "__annotations__",
+)
+
+
+def fastwraps(func: t.Callable[..., t.Any], wrapper: WrapperT) -> WrapperT:
+    """Copies the metadata of `func` on `wrapper`, a lighter `functools.wraps`.
+    Like `functools.update_wrapper`, the attributes missing on `func` (builtins,
+    classes, `functools.partial` objects...) are skipped.
+    """
+    for attr in WRAPPER_ASSIGNMENTS:
+        try:
+            value = getattr(func, attr)
+        except AttributeError:
+            pass
+        else:
+            setattr(wrapper, attr, value)
+    wrapper.__dict__.update(getattr(func, "__dict__", {}))
+    wrapper.__wrapped__ = func  # type: ignore
+    return wrapper
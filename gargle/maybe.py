@@ -5,9 +5,10 @@ from __future__ import annotations
 import functools
 import importlib.util
 import typing as t
-from dataclasses import dataclass
+from dataclasses import FrozenInstanceError
 
 from gargle import result
+from gargle._wraps import fastwraps
 
 __all__ = (
     "Maybe",
@@ -25,6 +26,8 @@ __all__ = (
     "cat_maybes",
     "map_maybe",
     "maybe_wrapped",
+    "maybe_wrapped_cached",
+    "CachedMaybeFunc",
 )
 ValueT = t.TypeVar("ValueT")
 OutT = t.TypeVar("OutT")
@@ -35,52 +38,52 @@ T4 = t.TypeVar("T4")
 T5 = t.TypeVar("T5")
 P = t.ParamSpec("P")
 
+_HAS_PYDANTIC = importlib.util.find_spec("pydantic") is not None
+
 
 class _MaybeInternal(t.Generic[ValueT]):
-    """Internal class gathering common methods for the maybe classes."""
+    """Internal base class of the maybe classes."""
 
-    if importlib.util.find_spec("pydantic") is not None:
-        from pydantic.fields import ModelField
+    __slots__ = ()
 
-        @classmethod
-        def __get_validators__(
-            cls,
-        ) -> t.Iterable[t.Callable[[t.Any, t.Any], Maybe[ValueT]]]:
-            """Yields validator for pydantic."""
-            yield cls._pydantic_validate
+    _is_some: t.ClassVar[bool]
 
-        @classmethod
-        def _pydantic_validate(cls, value: t.Any, field: ModelField) -> Maybe[ValueT]:
-            from pydantic import ValidationError
+    def __setattr__(self, name: str, value: t.Any) -> None:
+        raise FrozenInstanceError(f"cannot assign to field {name!r}")
 
-            value = as_maybe_flat(value)
+    def __delattr__(self, name: str) -> None:
+        raise FrozenInstanceError(f"cannot delete field {name!r}")
 
-            if not field.sub_fields or value.is_nothing():
-                return value
 
-            sub_field = field.sub_fields[0]
-            valid_value, error = sub_field.validate(value._value, {}, loc="maybe_value")
-            if error:
-                # quick hack to avoid raising 2 validation errors
-                # the validation will be called for both class of the `Maybe` union
-                # (`Some` and `Nothing`) and we want to raise only one error
-                errors = [error] if field.type_ is Some else []
+class Some(_MaybeInternal[ValueT]):
+    __slots__ = ("_value",)
+    __match_args__ = ("_value",)
 
-                raise ValidationError(errors, t.cast(t.Any, cls))
+    _is_some: t.ClassVar[bool] = True
+    _value: ValueT
 
-            return as_maybe(valid_value)
+    def __init__(self, _value: ValueT) -> None:
+        object.__setattr__(self, "_value", _value)
 
-    @t.overload
-    def from_maybe(self, *, default: t.Callable[[], T] | T) -> ValueT | T:
-        ...
+    def __eq__(self, other: object) -> bool:
+        if type(other) is not Some:
+            return NotImplemented
+        value = t.cast("Some[t.Any]", other)._value
+        return value is self._value or value == self._value
 
-    @t.overload
-    def from_maybe(self, *, default: T | None = None) -> ValueT | T | None:
-        ...
+    def __hash__(self) -> int:
+        return hash((Some, self._value))
 
-    def from_maybe(
-        self, *, default: t.Callable[[], T] | T | None = None
-    ) -> ValueT | T | None:
+    def __repr__(self) -> str:
+        return f"Some({self._value!r})"
+
+    def __reduce__(self) -> tuple[t.Any, ...]:
+        return (Some, (self._value,))
+
+    def __contains__(self, value: t.Any) -> bool:
+        return self._value is value or self._value == value
+
+    def from_maybe(self, default: t.Callable[[], T] | T | None = None) -> ValueT:
         """Unwraps the value in the `Maybe`
         `Nothing` returns `None` unless `default` is specified.
 
@@ -99,7 +102,7 @@ class _MaybeInternal(t.Generic[ValueT]):
         >>> Nothing().from_maybe(default=lambda: int("10"))
         10
         """
-        return from_maybe(t.cast(Maybe[ValueT], self), default=default)
+        return self._value
 
     def is_nothing(self) -> bool:
         """Checks if a maybe value is `Nothing`.
@@ -110,7 +113,7 @@ class _MaybeInternal(t.Generic[ValueT]):
         >>> is_nothing(Nothing())
         True
         """
-        return isinstance(self, Nothing)
+        return False
 
     def is_some(self) -> bool:
         """Checks if a maybe value is `Some`.
@@ -121,50 +124,79 @@ class _MaybeInternal(t.Generic[ValueT]):
         >>> is_some(Nothing())
         False
         """
-        return isinstance(self, Some)
-
+        return True
 
-@dataclass(frozen=True, repr=False)
-class Some(_MaybeInternal[ValueT]):
-    _value: ValueT
+    def map(self, func: t.Callable[[ValueT], OutT]) -> Maybe[OutT]:
+        """Calls the `func` with the value wrapped in `Maybe` if `Some`.
 
-    def __repr__(self) -> str:
-        return f"Some({self._value!r})"
+        >>> Some(5).map(lambda x: x + 1)
+        Some(6)
 
-    def __contains__(self, value: t.Any) -> bool:
-        return self._value == value
+        >>> Nothing().map(lambda x: x + 1)
+        Nothing()
+        """
+        return Some(func(self._value))
 
-    def from_maybe(self, *, default: t.Callable[[], T] | T | None = None) -> ValueT:
-        """Unwraps the value in the `Maybe`
-        `Nothing` returns `None` unless `default` is specified.
+    @t.overload
+    def map_chain(self, func1: t.Callable[[ValueT], T], /) -> Maybe[T]:
+        ...
 
-        >>> Some(5).from_maybe()
-        5
+    @t.overload
+    def map_chain(
+        self, func1: t.Callable[[ValueT], T], func2: t.Callable[[T], T2], /
+    ) -> Maybe[T2]:
+        ...
 
-        >>> Some(5).from_maybe(default=10)
-        5
+    @t.overload
+    def map_chain(
+        self,
+        func1: t.Callable[[ValueT], T],
+        func2: t.Callable[[T], T2],
+        func3: t.Callable[[T2], T3],
+        /,
+    ) -> Maybe[T3]:
+        ...
 
-        >>> Nothing().from_maybe() is None
-        True
+    @t.overload
+    def map_chain(
+        self,
+        func1: t.Callable[[ValueT], T],
+        func2: t.Callable[[T], T2],
+        func3: t.Callable[[T2], T3],
+        func4: t.Callable[[T3], T4],
+        /,
+    ) -> Maybe[T4]:
+        ...
 
-        >>> Nothing().from_maybe(default=10)
-        10
+    @t.overload
+    def map_chain(
+        self,
+        func1: t.Callable[[ValueT], T],
+        func2: t.Callable[[T], T2],
+        func3: t.Callable[[T2], T3],
+        func4: t.Callable[[T3], T4],
+        func5: t.Callable[[T4], T5],
+        /,
+    ) -> Maybe[T5]:
+        ...
 
-        >>> Nothing().from_maybe(default=lambda: int("10"))
-        10
-        """
-        return self._value
+    def map_chain(self, *funcs: t.Callable[[t.Any], t.Any]) -> Maybe[t.Any]:
+        """Like chaining several `map` calls, `Some(5).map(f).map(g)`, but only
+        the final value gets wrapped in `Maybe`.
 
-    def map(self, func: t.Callable[[ValueT], OutT]) -> Maybe[OutT]:
-        """Calls the `func` with the value wrapped in `Maybe` if `Some`.
+        >>> Some(5).map_chain(lambda x: x + 1, str)
+        Some('6')
 
-        >>> Some(5).map(lambda x: x + 1)
-        Some(6)
+        >>> Some(5).map_chain(lambda x: x + 1, lambda x: x * 2, str)
+        Some('12')
 
-        >>> Nothing().map(lambda x: x + 1)
+        >>> Nothing().map_chain(lambda x: x + 1, str)
         Nothing()
         """
-        return Some(func(self._value))
+        value = self._value
+        for func in funcs:
+            value = func(value)
+        return Some(value)
 
     def map_or(
         self, func: t.Callable[[ValueT], OutT], *, default: OutT | t.Callable[[], OutT]
@@ -222,7 +254,8 @@ class Some(_MaybeInternal[ValueT]):
         >>> Nothing().and_then_opt(lambda k: {"key1": "value1"}.get(k))
         Nothing()
         """
-        return as_maybe(func(self._value))
+        value = func(self._value)
+        return _NOTHING if value is None else Some(value)
 
     @t.overload
     def get(self: Maybe[dict[T, T2]], key: T) -> Maybe[T2]:
@@ -250,10 +283,18 @@ class Some(_MaybeInternal[ValueT]):
         >>> Nothing().get(2)
         Nothing()
         """
+        value = t.cast("Some[t.Any]", self)._value
+        value_type = type(t.cast(object, value))
         try:
-            return self.map(lambda v: v[key])
+            if value_type is dict:
+                item = value.get(key, _MISSING)
+                return _NOTHING if item is _MISSING else Some(item)
+            if value_type is list and type(key) is int:
+                size = len(value)
+                return Some(value[key]) if -size <= key < size else _NOTHING
+            return Some(value[key])
         except (IndexError, KeyError, TypeError):
-            return Nothing()
+            return _NOTHING
 
     def filter(self, predicate: t.Callable[[ValueT], bool]) -> Maybe[ValueT]:
         """Checks if `Some` and the wrapped value passes the `predicate`.
@@ -267,7 +308,8 @@ class Some(_MaybeInternal[ValueT]):
         >>> Nothing().filter(lambda x: x > 2)
         Nothing()
         """
-        return Some(self._value) if predicate(self._value) else Nothing()
+        value = self._value
+        return Some(value) if predicate(value) else _NOTHING
 
     def or_(self, mayb: Maybe[ValueT] | t.Callable[[], Maybe[ValueT]]) -> Maybe[ValueT]:
         """Return value if `Some` otherwise returns `mayb`.
@@ -298,11 +340,7 @@ class Some(_MaybeInternal[ValueT]):
         >>> Nothing().xor(Nothing())
         Nothing()
         """
-        match mayb:
-            case Nothing():
-                return Some(self._value)
-            case _:
-                return Nothing()
+        return self if type(mayb) is Nothing else _NOTHING
 
     @t.overload
     def zip(self, mayb1: Maybe[T], /) -> Maybe[tuple[ValueT, T]]:
@@ -351,11 +389,12 @@ class Some(_MaybeInternal[ValueT]):
         >>> Nothing().zip(Some(6))
         Nothing()
         """
-        match sequence(maybs):
-            case Some(values):
-                return Some((self._value, *values))
-            case Nothing():
-                return Nothing()
+        values = [self._value]
+        for mayb in maybs:
+            if type(mayb) is not Some:
+                return _NOTHING
+            values.append(mayb._value)
+        return Some(tuple(values))
 
     @t.overload
     def zip_with(
@@ -424,7 +463,12 @@ class Some(_MaybeInternal[ValueT]):
         >>> Nothing().zip_with(merge_dicts, Some({"key2": "value2"}))
         Nothing()
         """
-        return self.zip(*maybs).map(lambda values: func(*values))
+        args = [self._value]
+        for mayb in maybs:
+            if type(mayb) is not Some:
+                return _NOTHING
+            args.append(mayb._value)
+        return Some(func(*args))
 
     def unzip(self: Maybe[tuple[T, T2]]) -> tuple[Maybe[T], Maybe[T2]]:
         """Turns a `Maybe tuple` into a `tuple` of `Maybe`s.
@@ -435,11 +479,12 @@ class Some(_MaybeInternal[ValueT]):
         >>> Nothing().unzip()
         (Nothing(), Nothing())
         """
+        values: tuple[t.Any, ...] = t.cast("Some[tuple[T, T2]]", self)._value
+        if len(values) == 2:
+            first, second = values
+            return (Some(first), Some(second))
         return t.cast(
-            tuple[Maybe[T], Maybe[T2]],
-            tuple(
-                Some(value) for value in t.cast(Some[tuple[t.Any, ...]], self)._value
-            ),
+            "tuple[Maybe[T], Maybe[T2]]", tuple([Some(value) for value in values])
         )
 
     def ok_or(self, err: T | t.Callable[[], T]) -> result.Result[ValueT, T]:
@@ -454,24 +499,58 @@ class Some(_MaybeInternal[ValueT]):
         return result.Ok(self._value)
 
 
-@dataclass(frozen=True, repr=False)
-class Nothing(_MaybeInternal[ValueT]):
+class _NothingMeta(type):
+    """Metaclass making `Nothing` a singleton, `Nothing` holds no value so every
+    instance would be the same.
+
+    >>> Nothing() is Nothing()
+    True
+    """
+
+    _instance: t.Any = None
+
+    def __call__(cls: type[T]) -> T:
+        meta = t.cast(_NothingMeta, cls)
+        if meta._instance is None:
+            meta._instance = super().__call__()
+        return meta._instance
+
+
+class Nothing(_MaybeInternal[ValueT], metaclass=_NothingMeta):
+    __slots__ = ()
+
+    _is_some: t.ClassVar[bool] = False
+
+    def __init__(self) -> None:
+        pass
+
+    def __eq__(self, other: object) -> bool:
+        if type(other) is not Nothing:
+            return NotImplemented
+        return True
+
+    def __hash__(self) -> int:
+        return hash((Nothing,))
+
     def __contains__(self, value: t.Any) -> bool:
         return False
 
     def __repr__(self) -> str:
         return "Nothing()"
 
+    def __reduce__(self) -> tuple[t.Any, ...]:
+        return (Nothing, ())
+
     @t.overload
-    def from_maybe(self, *, default: t.Callable[[], T] | T) -> ValueT | T:
+    def from_maybe(self, default: t.Callable[[], T] | T) -> ValueT | T:
         ...
 
     @t.overload
-    def from_maybe(self, *, default: T | None = None) -> ValueT | T | None:
+    def from_maybe(self, default: T | None = None) -> ValueT | T | None:
         ...
 
     def from_maybe(
-        self, *, default: t.Callable[[], T] | T | None = None
+        self, default: t.Callable[[], T] | T | None = None
     ) -> ValueT | T | None:
         """Unwraps the value in the `Maybe`
         `Nothing` returns `None` unless `default` is specified.
@@ -491,8 +570,32 @@ class Nothing(_MaybeInternal[ValueT]):
         >>> Nothing().from_maybe(default=lambda: int("10"))
         10
         """
+        if default is None:
+            return None
         return default() if callable(default) else default
 
+    def is_nothing(self) -> bool:
+        """Checks if a maybe value is `Nothing`.
+
+        >>> is_nothing(Some(5))
+        False
+
+        >>> is_nothing(Nothing())
+        True
+        """
+        return True
+
+    def is_some(self) -> bool:
+        """Checks if a maybe value is `Some`.
+
+        >>> is_some(Some(5))
+        True
+
+        >>> is_some(Nothing())
+        False
+        """
+        return False
+
     def map(self, func: t.Callable[[ValueT], OutT]) -> Maybe[OutT]:
         """Calls the `func` with the value wrapped in `Maybe` if `Some`.
 
@@ -502,7 +605,65 @@ class Nothing(_MaybeInternal[ValueT]):
         >>> Nothing().map(lambda x: x + 1)
         Nothing()
         """
-        return Nothing()
+        return _NOTHING
+
+    @t.overload
+    def map_chain(self, func1: t.Callable[[ValueT], T], /) -> Maybe[T]:
+        ...
+
+    @t.overload
+    def map_chain(
+        self, func1: t.Callable[[ValueT], T], func2: t.Callable[[T], T2], /
+    ) -> Maybe[T2]:
+        ...
+
+    @t.overload
+    def map_chain(
+        self,
+        func1: t.Callable[[ValueT], T],
+        func2: t.Callable[[T], T2],
+        func3: t.Callable[[T2], T3],
+        /,
+    ) -> Maybe[T3]:
+        ...
+
+    @t.overload
+    def map_chain(
+        self,
+        func1: t.Callable[[ValueT], T],
+        func2: t.Callable[[T], T2],
+        func3: t.Callable[[T2], T3],
+        func4: t.Callable[[T3], T4],
+        /,
+    ) -> Maybe[T4]:
+        ...
+
+    @t.overload
+    def map_chain(
+        self,
+        func1: t.Callable[[ValueT], T],
+        func2: t.Callable[[T], T2],
+        func3: t.Callable[[T2], T3],
+        func4: t.Callable[[T3], T4],
+        func5: t.Callable[[T4], T5],
+        /,
+    ) -> Maybe[T5]:
+        ...
+
+    def map_chain(self, *funcs: t.Callable[[t.Any], t.Any]) -> Maybe[t.Any]:
+        """Like chaining several `map` calls, `Some(5).map(f).map(g)`, but only
+        the final value gets wrapped in `Maybe`.
+
+        >>> Some(5).map_chain(lambda x: x + 1, str)
+        Some('6')
+
+        >>> Some(5).map_chain(lambda x: x + 1, lambda x: x * 2, str)
+        Some('12')
+
+        >>> Nothing().map_chain(lambda x: x + 1, str)
+        Nothing()
+        """
+        return _NOTHING
 
     def map_or(
         self, func: t.Callable[[ValueT], OutT], *, default: OutT | t.Callable[[], OutT]
@@ -533,7 +694,7 @@ class Nothing(_MaybeInternal[ValueT]):
         >>> Nothing().and_(Some(5))
         Nothing()
         """
-        return Nothing()
+        return _NOTHING
 
     def and_then(self, func: t.Callable[[ValueT], Maybe[OutT]]) -> Maybe[OutT]:
         """Returns the result of calling `func` with the wrapped value if `Some`
@@ -545,7 +706,7 @@ class Nothing(_MaybeInternal[ValueT]):
         >>> Nothing().and_then(lambda x: Some(str(x + 10)))
         Nothing()
         """
-        return Nothing()
+        return _NOTHING
 
     def and_then_opt(self, func: t.Callable[[ValueT], OutT | None]) -> Maybe[OutT]:
         """Same as `and_then` but `func` returns `value | None` which gets wrapped
@@ -560,7 +721,7 @@ class Nothing(_MaybeInternal[ValueT]):
         >>> Nothing().and_then_opt(lambda k: {"key1": "value1"}.get(k))
         Nothing()
         """
-        return Nothing()
+        return _NOTHING
 
     @t.overload
     def get(self: Maybe[dict[T, T2]], key: T) -> Maybe[T2]:
@@ -588,7 +749,7 @@ class Nothing(_MaybeInternal[ValueT]):
         >>> Nothing().get(2)
         Nothing()
         """
-        return Nothing()
+        return _NOTHING
 
     def filter(self, predicate: t.Callable[[ValueT], bool]) -> Maybe[ValueT]:
         """Checks if `Some` and the wrapped value passes the `predicate`.
@@ -602,7 +763,7 @@ class Nothing(_MaybeInternal[ValueT]):
         >>> Nothing().filter(lambda x: x > 2)
         Nothing()
         """
-        return Nothing()
+        return _NOTHING
 
     def or_(self, mayb: Maybe[ValueT] | t.Callable[[], Maybe[ValueT]]) -> Maybe[ValueT]:
         """Return value if `Some` otherwise returns `mayb`.
@@ -633,11 +794,7 @@ class Nothing(_MaybeInternal[ValueT]):
         >>> Nothing().xor(Nothing())
         Nothing()
         """
-        match mayb:
-            case Some(value):
-                return Some(value)
-            case _:
-                return Nothing()
+        return mayb if type(mayb) is Some else _NOTHING
 
     @t.overload
     def zip(self, mayb1: Maybe[T], /) -> Maybe[tuple[ValueT, T]]:
@@ -686,7 +843,7 @@ class Nothing(_MaybeInternal[ValueT]):
         >>> Nothing().zip(Some(6))
         Nothing()
         """
-        return Nothing()
+        return _NOTHING
 
     @t.overload
     def zip_with(
@@ -755,7 +912,7 @@ class Nothing(_MaybeInternal[ValueT]):
         >>> Nothing().zip_with(merge_dicts, Some({"key2": "value2"}))
         Nothing()
         """
-        return Nothing()
+        return _NOTHING
 
     def unzip(self: Maybe[tuple[T, T2]]) -> tuple[Maybe[T], Maybe[T2]]:
         """Turns a `Maybe tuple` into a `tuple` of `Maybe`s.
@@ -766,7 +923,7 @@ class Nothing(_MaybeInternal[ValueT]):
         >>> Nothing().unzip()
         (Nothing(), Nothing())
         """
-        return (Nothing(), Nothing())
+        return (_NOTHING, _NOTHING)
 
     def ok_or(self, err: T | t.Callable[[], T]) -> result.Result[ValueT, T]:
         """Convert `Maybe` to `Result`.
@@ -781,24 +938,26 @@ class Nothing(_MaybeInternal[ValueT]):
 
 
 Maybe = Some[ValueT] | Nothing[ValueT]
+_NOTHING: Nothing[t.Any] = Nothing()
+_MISSING = object()
 
 
 @t.overload
 def from_maybe(
-    maybe_value: Maybe[ValueT], *, default: t.Callable[[], T] | T
+    maybe_value: Maybe[ValueT], default: t.Callable[[], T] | T
 ) -> ValueT | T:
     ...
 
 
 @t.overload
 def from_maybe(
-    maybe_value: Maybe[ValueT], *, default: T | None = None
+    maybe_value: Maybe[ValueT], default: T | None = None
 ) -> ValueT | T | None:
     ...
 
 
 def from_maybe(
-    maybe_value: Maybe[ValueT], *, default: t.Callable[[], T] | T | None = None
+    maybe_value: Maybe[ValueT], default: t.Callable[[], T] | T | None = None
 ) -> ValueT | T | None:
     """Unwraps the value in a `Maybe`
     `Nothing` returns `None` unless `default` is specified.
@@ -815,18 +974,19 @@ def from_maybe(
     >>> from_maybe(Nothing(), default=10)
     10
 
+    >>> from_maybe(Nothing(), 10)
+    10
+
     >>> from_maybe(Nothing(), default=lambda: int("10"))
     10
     """
-    match maybe_value:
-        case Some(value):
-            return value
-        case Nothing() if default is None:
-            return None
-        case Nothing():
-            if callable(default):
-                return default()
-            return default
+    if type(maybe_value) is Some:
+        return maybe_value._value
+    if default is None:
+        return None
+    if callable(default):
+        return default()
+    return default
 
 
 def as_maybe(value: ValueT | None) -> Maybe[ValueT]:
@@ -839,7 +999,7 @@ def as_maybe(value: ValueT | None) -> Maybe[ValueT]:
     Nothing()
     """
     if value is None:
-        return Nothing()
+        return _NOTHING
     return Some(value)
 
 
@@ -868,8 +1028,8 @@ def as_maybe_flat(value: Maybe[ValueT] | ValueT | None) -> Maybe[ValueT]:
     >>> as_maybe_flat(Some(5))
     Some(5)
     """
-    if isinstance(value, Some | Nothing):
-        return t.cast(Maybe[ValueT], value)
+    if isinstance(value, _MaybeInternal):
+        return t.cast("Maybe[ValueT]", value)
     return as_maybe(value)
 
 
@@ -882,7 +1042,7 @@ def is_nothing(maybe_value: Maybe[ValueT]) -> t.TypeGuard[Nothing[ValueT]]:
     >>> is_nothing(Nothing())
     True
     """
-    return maybe_value.is_nothing()
+    return not maybe_value._is_some
 
 
 def is_some(maybe_value: Maybe[ValueT]) -> t.TypeGuard[Some[ValueT]]:
@@ -894,7 +1054,7 @@ def is_some(maybe_value: Maybe[ValueT]) -> t.TypeGuard[Some[ValueT]]:
     >>> is_some(Nothing())
     False
     """
-    return maybe_value.is_some()
+    return maybe_value._is_some
 
 
 def is_maybe(value: t.Any) -> t.TypeGuard[Maybe[t.Any]]:
@@ -909,7 +1069,7 @@ def is_maybe(value: t.Any) -> t.TypeGuard[Maybe[t.Any]]:
     >>> is_maybe(5)
     False
     """
-    return isinstance(value, Some | Nothing)
+    return isinstance(value, _MaybeInternal)
 
 
 @t.overload
@@ -939,10 +1099,13 @@ def maybe_get(some_seq: t.Any, key: t.Any) -> Maybe[T] | Maybe[T2]:
     >>> maybe_get({"key1": "value1"}, "key2")
     Nothing()
     """
+    if type(some_seq) is dict:
+        value = t.cast("dict[t.Any, t.Any]", some_seq).get(key, _MISSING)
+        return _NOTHING if value is _MISSING else Some(value)
     try:
         return Some(some_seq[key])
     except (KeyError, IndexError):
-        return Nothing()
+        return _NOTHING
 
 
 def sequence(mayb_iter: t.Iterable[Maybe[T]]) -> Maybe[list[T]]:
@@ -963,12 +1126,11 @@ def sequence(mayb_iter: t.Iterable[Maybe[T]]) -> Maybe[list[T]]:
     Nothing()
     """
     res: list[T] = []
+    append = res.append
     for mayb in mayb_iter:
-        match mayb:
-            case Some(value):
-                res.append(value)
-            case Nothing():
-                return Nothing()
+        if type(mayb) is not Some:
+            return _NOTHING
+        append(mayb._value)
     return Some(res)
 
 
@@ -988,9 +1150,9 @@ def maybe_next(it: t.Iterable[T]) -> Maybe[T]:
     Nothing()
     """
     try:
-        return Some(next(i for i in it))
+        return Some(next(iter(it)))
     except StopIteration:
-        return Nothing()
+        return _NOTHING
 
 
 def maybe_apply(func: t.Callable[[T], T2], mayb: Maybe[T], default: T2) -> T2:
@@ -1003,15 +1165,13 @@ def maybe_apply(func: t.Callable[[T], T2], mayb: Maybe[T], default: T2) -> T2:
     >>> maybe_apply(lambda x: x + 1, Nothing(), 0)
     0
     """
-    match mayb:
-        case Some(value):
-            return func(value)
-        case Nothing():
-            return default
+    if type(mayb) is Some:
+        return func(mayb._value)
+    return default
 
 
-def cat_maybes(lst: list[Maybe[T]]) -> list[T]:
-    """Returns a list of all the `Some` values in the list of `Maybe`s.
+def cat_maybes(lst: t.Iterable[Maybe[T]]) -> list[T]:
+    """Returns a list of all the `Some` values in the iterable of `Maybe`s.
 
     >>> cat_maybes([Some(1), Some(2), Some(3)])
     [1, 2, 3]
@@ -1021,12 +1181,15 @@ def cat_maybes(lst: list[Maybe[T]]) -> list[T]:
 
     >>> cat_maybes([Nothing(), Nothing()])
     []
+
+    >>> cat_maybes(as_maybe(x) for x in [1, None, 3])
+    [1, 3]
     """
-    return [value.from_maybe() for value in lst if is_some(value)]
+    return [value._value for value in lst if type(value) is Some]
 
 
-def map_maybe(func: t.Callable[[T], Maybe[T2]], lst: list[T]) -> list[T2]:
-    """Maps a function returning `Maybe`s over a list,
+def map_maybe(func: t.Callable[[T], Maybe[T2]], lst: t.Iterable[T]) -> list[T2]:
+    """Maps a function returning `Maybe`s over an iterable,
     returning a list of the `Some` results.
 
     >>> map_maybe(lambda x: Some(x + 1), [1, 2, 3])
@@ -1040,8 +1203,11 @@ def map_maybe(func: t.Callable[[T], Maybe[T2]], lst: list[T]) -> list[T2]:
 
     >>> map_maybe(lambda x: Some(0) if x is None else Some(1), [None, 5, None, 7])
     [0, 1, 0, 1]
+
+    >>> map_maybe(lambda x: Some(x * 2), range(3))
+    [0, 2, 4]
     """
-    return [res.from_maybe() for value in lst if is_some(res := func(value))]
+    return [res._value for value in lst if type(res := func(value)) is Some]
 
 
 def maybe_wrapped(func: t.Callable[P, T | None]) -> t.Callable[P, Maybe[T]]:
@@ -1059,23 +1225,88 @@ def maybe_wrapped(func: t.Callable[P, T | None]) -> t.Callable[P, Maybe[T]]:
     Nothing()
     """
 
-    @functools.wraps(func)
     def wrapper(*args: P.args, **kwargs: P.kwargs) -> Maybe[T]:
         res = func(*args, **kwargs)
         return as_maybe(res)
 
-    return wrapper
+    return fastwraps(func, wrapper)
+
+
+class CachedMaybeFunc(t.Protocol[P, T]):
+    """Function decorated with `maybe_wrapped_cached`, it keeps the cache methods
+    of `functools.lru_cache`.
+    """
+
+    def __call__(self, *args: P.args, **kwargs: P.kwargs) -> Maybe[T]:
+        ...
+
+    def cache_info(self) -> functools._CacheInfo:
+        ...
+
+    def cache_clear(self) -> None:
+        ...
 
 
-if importlib.util.find_spec("pydantic") is not None:
+def maybe_wrapped_cached(
+    maxsize: int | None = 128,
+) -> t.Callable[[t.Callable[P, T | None]], CachedMaybeFunc[P, T]]:
+    """Like `maybe_wrapped` but the results are memoized with `functools.lru_cache`
+    keeping at most `maxsize` of them, the arguments need to be hashable.
+
+    >>> @maybe_wrapped_cached()
+    ... def optional_value(key: str) -> str | None:
+    ...     print(f"looking up {key}")
+    ...     return {"value1": "res1"}.get(key)
+
+    >>> optional_value("value1")
+    looking up value1
+    Some('res1')
+
+    >>> optional_value("value1")
+    Some('res1')
+
+    >>> optional_value("value2")
+    looking up value2
+    Nothing()
+
+    >>> optional_value.cache_info().currsize
+    2
+
+    >>> optional_value.cache_clear()
+    >>> optional_value("value1")
+    looking up value1
+    Some('res1')
+    """
+
+    def decorator(func: t.Callable[P, T | None]) -> CachedMaybeFunc[P, T]:
+        return t.cast(
+            "CachedMaybeFunc[P, T]", functools.lru_cache(maxsize)(maybe_wrapped(func))
+        )
+
+    return decorator
+
+
+if _HAS_PYDANTIC:
     from pydantic import Field, validator  # type: ignore
     from pydantic.main import ModelMetaclass
 
-    def _is_maybe_type(tp: t.Any) -> bool:
+    from gargle._pydantic_bridge import attach
+
+    attach(_MaybeInternal)
+
+    @functools.lru_cache(maxsize=1024)
+    def _is_maybe_type_cached(tp: t.Any) -> bool:
         return hasattr(tp, "__args__") and tuple(
             tp_arg.__origin__ for tp_arg in tp.__args__
         ) == (Some, Nothing)
 
+    def _is_maybe_type(tp: t.Any) -> bool:
+        try:
+            return _is_maybe_type_cached(tp)
+        except TypeError:
+            # unhashable annotation, e.g. `Annotated` with a dict as metadata
+            return _is_maybe_type_cached.__wrapped__(tp)
+
     @t.dataclass_transform(kw_only_default=True, field_specifiers=(Field,))
     class OptionalAsMaybe(ModelMetaclass):
         def __new__(
@@ -1097,7 +1328,7 @@ if importlib.util.find_spec("pydantic") is not None:
 
             namespaces["_gargle_optional_as_maybe_validator"] = validator(
                 *maybe_fields, pre=True, always=True, allow_reuse=True
-            )(lambda v: Nothing() if v is None else v)
+            )(lambda v: _NOTHING if v is None else v)
 
             return super().__new__(  # type: ignore
                 cls, name, bases, namespaces, **kwargs
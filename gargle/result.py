@@ -1,10 +1,13 @@
+# pyright: reportPrivateUsage=false
+
 from __future__ import annotations
 
-import functools
 import typing as t
-from dataclasses import dataclass
+import warnings
+from dataclasses import FrozenInstanceError
 
 from gargle import maybe
+from gargle._wraps import fastwraps
 
 __all__ = ("Err", "Ok", "Result", "result_wrapped", "result_wrapped_for")
 OutT = t.TypeVar("OutT")
@@ -18,7 +21,51 @@ class UnwrapError(Exception):
     ...
 
 
+def _warn_callable_default(method: str, replacement: str) -> None:
+    warnings.warn(
+        f"passing a callable to `{method}` is deprecated, use `{replacement}` instead",
+        DeprecationWarning,
+        stacklevel=3,
+    )
+
+
 class _ResultInternal(t.Generic[OkT, ErrT]):
+    __slots__ = ()
+
+    def __setattr__(self, name: str, value: t.Any) -> None:
+        raise FrozenInstanceError(f"cannot assign to field {name!r}")
+
+    def __delattr__(self, name: str) -> None:
+        raise FrozenInstanceError(f"cannot delete field {name!r}")
+
+
+class Ok(_ResultInternal[OkT, ErrT]):
+    __slots__ = ("_value",)
+    __match_args__ = ("_value",)
+
+    _value: OkT
+
+    def __init__(self, _value: OkT) -> None:
+        object.__setattr__(self, "_value", _value)
+
+    def __eq__(self, other: object) -> bool:
+        if type(other) is not Ok:
+            return NotImplemented
+        value = t.cast("Ok[t.Any, t.Any]", other)._value
+        return value is self._value or value == self._value
+
+    def __hash__(self) -> int:
+        return hash((Ok, self._value))
+
+    def __repr__(self) -> str:
+        return f"Ok({self._value!r})"
+
+    def __reduce__(self) -> tuple[t.Any, ...]:
+        return (Ok, (self._value,))
+
+    def __contains__(self, value: t.Any) -> bool:
+        return self._value is value or self._value == value
+
     def unwrap(self, exc: type[Exception] | None = None) -> OkT:
         """Unwrap the value in `Result`.
         Returning the value inside if `Ok else raising an exception.
@@ -33,40 +80,21 @@ class _ResultInternal(t.Generic[OkT, ErrT]):
         ...
         gargle.result.UnwrapError: bad value
         """
-        match t.cast(Result[OkT, ErrT], self):
-            case Ok(value):
-                return value
-            case Err(err):
-                if exc is not None:
-                    raise exc(err)
-                raise UnwrapError(err)
+        return self._value
 
-    def unwrap_or(self, default: OkT | t.Callable[[], OkT]) -> OkT:
+    def unwrap_or(self, default: OkT) -> OkT:
         """Unwrap the value in `Result`.
         Returning the value inside if `Ok otherwise the `default`.
 
+        Passing a callable as `default` is deprecated, use `unwrap_or_else` instead.
+
         >>> Ok(5).unwrap_or(10)
         5
 
         >>> Err("bad value").unwrap_or(10)
         10
         """
-        match t.cast(Result[OkT, ErrT], self):
-            case Ok(value):
-                return value
-            case Err():
-                return default() if callable(default) else default
-
-
-@dataclass(frozen=True, repr=False)
-class Ok(_ResultInternal[OkT, ErrT]):
-    _value: OkT
-
-    def __repr__(self) -> str:
-        return f"Ok({self._value!r})"
-
-    def __contains__(self, value: t.Any) -> bool:
-        return self._value == value
+        return self._value
 
     def unwrap_raise(self: Result[OkT, Exception]) -> OkT:
         """Like `unwrap` but `Err` value needs to be an exception and it will be raised.
@@ -79,7 +107,19 @@ class Ok(_ResultInternal[OkT, ErrT]):
         ...
         ValueError: bad value
         """
-        return t.cast(Ok[OkT, ErrT], self)._value
+        return t.cast("Ok[OkT, ErrT]", self)._value
+
+    def unwrap_or_else(self, default: t.Callable[[], OkT]) -> OkT:
+        """Like `unwrap_or` but `default` is always called to get the value to return
+        if `Err`.
+
+        >>> Ok(5).unwrap_or_else(lambda: 10)
+        5
+
+        >>> Err("bad value").unwrap_or_else(lambda: 10)
+        10
+        """
+        return self._value
 
     def map(self, func: t.Callable[[OkT], OutT]) -> Result[OutT, ErrT]:
         """Calls the `func` with the value wrapped in `Result` if `Ok`.
@@ -92,19 +132,30 @@ class Ok(_ResultInternal[OkT, ErrT]):
         """
         return Ok(func(self._value))
 
-    def map_or(
-        self, func: t.Callable[[OkT], OutT], *, default: OutT | t.Callable[[], OutT]
-    ) -> OutT:
+    def map_or(self, func: t.Callable[[OkT], OutT], *, default: OutT) -> OutT:
         """Calls the `func` with the value wrapped in `Result` if `Ok`
         returning the unwrapped value else return `default`.
 
+        Passing a callable as `default` is deprecated, use `map_or_else` instead.
+
         >>> Ok(5).map_or(lambda x: x + 1, default=10)
         6
 
         >>> Err("bad value").map_or(lambda x: x + 1, default=10)
         10
+        """
+        return func(self._value)
 
-        >>> Err("bad value").map_or(lambda x: x + 1, default=lambda: int("10"))
+    def map_or_else(
+        self, func: t.Callable[[OkT], OutT], *, default: t.Callable[[], OutT]
+    ) -> OutT:
+        """Like `map_or` but `default` is always called to get the value to return
+        if `Err`.
+
+        >>> Ok(5).map_or_else(lambda x: x + 1, default=lambda: 10)
+        6
+
+        >>> Err("bad value").map_or_else(lambda x: x + 1, default=lambda: 10)
         10
         """
         return func(self._value)
@@ -148,18 +199,26 @@ class Ok(_ResultInternal[OkT, ErrT]):
         """
         return func(self._value)
 
-    def or_(
-        self, res: Result[OkT, ErrT] | t.Callable[[], Result[OkT, ErrT]]
-    ) -> Result[OkT, ErrT]:
+    def or_(self, res: Result[OkT, ErrT]) -> Result[OkT, ErrT]:
         """Return value if `Ok` otherwise returns `res`.
 
+        Passing a callable as `res` is deprecated, use `or_else` instead.
+
         >>> Ok(5).or_(Ok(6))
         Ok(5)
 
         >>> Err("bad value").or_(Ok(5))
         Ok(5)
+        """
+        return Ok(self._value)
 
-        >>> Err("bad value").or_(lambda: Ok(str(10)))
+    def or_else(self, func: t.Callable[[], Result[OkT, ErrT]]) -> Result[OkT, ErrT]:
+        """Like `or_` but `func` is called to get the `Result` to return if `Err`.
+
+        >>> Ok(5).or_else(lambda: Ok(6))
+        Ok(5)
+
+        >>> Err("bad value").or_else(lambda: Ok(str(10)))
         Ok('10')
         """
         return Ok(self._value)
@@ -184,7 +243,7 @@ class Ok(_ResultInternal[OkT, ErrT]):
         >>> Err("bad value").err()
         Some('bad value')
         """
-        return maybe.Nothing()
+        return maybe._NOTHING
 
     def either(
         self, ok_func: t.Callable[[OkT], OutT], err_func: t.Callable[[ErrT], OutT]
@@ -200,11 +259,13 @@ class Ok(_ResultInternal[OkT, ErrT]):
         return ok_func(self._value)
 
     def filter_or(
-        self, predicate: t.Callable[[OkT], bool], err: ErrT | t.Callable[[], ErrT]
+        self, predicate: t.Callable[[OkT], bool], err: ErrT
     ) -> Result[OkT, ErrT]:
         """Checks if the `Ok` value passes the `predicate`. If not returns an `Err`
         containing `err` value.
 
+        Passing a callable as `err` is deprecated, use `filter_or_else` instead.
+
         >>> Ok(5).filter_or(lambda x: x > 3, "lower than 3")
         Ok(5)
 
@@ -214,11 +275,31 @@ class Ok(_ResultInternal[OkT, ErrT]):
         >>> Err("bad value").filter_or(lambda x: x > 7, "lower than 7")
         Err('bad value')
         """
-        return (
-            Ok(self._value)
-            if predicate(self._value)
-            else Err(err() if callable(err) else err)
-        )
+        value = self._value
+        if predicate(value):
+            return Ok(value)
+        if callable(err):
+            _warn_callable_default("filter_or", "filter_or_else")
+            return Err(t.cast("t.Callable[[], ErrT]", err)())
+        return Err(err)
+
+    def filter_or_else(
+        self, predicate: t.Callable[[OkT], bool], err: t.Callable[[], ErrT]
+    ) -> Result[OkT, ErrT]:
+        """Like `filter_or` but `err` is called to get the value to put in the `Err`
+        if the `predicate` fails.
+
+        >>> Ok(5).filter_or_else(lambda x: x > 3, lambda: "lower than 3")
+        Ok(5)
+
+        >>> Ok(5).filter_or_else(lambda x: x > 7, lambda: "lower than 7")
+        Err('lower than 7')
+
+        >>> Err("bad value").filter_or_else(lambda x: x > 7, lambda: "lower than 7")
+        Err('bad value')
+        """
+        value = self._value
+        return Ok(value) if predicate(value) else Err(err())
 
     def is_ok(self) -> bool:
         """Checks if the value is `Ok`.
@@ -271,15 +352,67 @@ class Ok(_ResultInternal[OkT, ErrT]):
         return False
 
 
-@dataclass(frozen=True, repr=False)
 class Err(_ResultInternal[OkT, ErrT]):
+    __slots__ = ("_value",)
+    __match_args__ = ("_value",)
+
     _value: ErrT
 
+    def __init__(self, _value: ErrT) -> None:
+        object.__setattr__(self, "_value", _value)
+
+    def __eq__(self, other: object) -> bool:
+        if type(other) is not Err:
+            return NotImplemented
+        value = t.cast("Err[t.Any, t.Any]", other)._value
+        return value is self._value or value == self._value
+
+    def __hash__(self) -> int:
+        return hash((Err, self._value))
+
     def __repr__(self) -> str:
         return f"Err({self._value!r})"
 
+    def __reduce__(self) -> tuple[t.Any, ...]:
+        return (Err, (self._value,))
+
     def __contains__(self, value: t.Any) -> bool:
-        return self._value == value
+        return self._value is value or self._value == value
+
+    def unwrap(self, exc: type[Exception] | None = None) -> OkT:
+        """Unwrap the value in `Result`.
+        Returning the value inside if `Ok else raising an exception.
+
+        Exception used is `UnwrapError` unless other specified in `exc`.
+
+        >>> Ok(5).unwrap()
+        5
+
+        >>> Err("bad value").unwrap()
+        Traceback (most recent call last):
+        ...
+        gargle.result.UnwrapError: bad value
+        """
+        if exc is not None:
+            raise exc(self._value)
+        raise UnwrapError(self._value)
+
+    def unwrap_or(self, default: OkT) -> OkT:
+        """Unwrap the value in `Result`.
+        Returning the value inside if `Ok otherwise the `default`.
+
+        Passing a callable as `default` is deprecated, use `unwrap_or_else` instead.
+
+        >>> Ok(5).unwrap_or(10)
+        5
+
+        >>> Err("bad value").unwrap_or(10)
+        10
+        """
+        if callable(default):
+            _warn_callable_default("unwrap_or", "unwrap_or_else")
+            return t.cast("t.Callable[[], OkT]", default)()
+        return default
 
     def unwrap_raise(self: Result[OkT, Exception]) -> OkT:
         """Like `unwrap` but `Err` value needs to be an exception and it will be raised.
@@ -292,7 +425,19 @@ class Err(_ResultInternal[OkT, ErrT]):
         ...
         ValueError: bad value
         """
-        raise t.cast(Err[OkT, Exception], self)._value
+        raise t.cast("Err[OkT, Exception]", self)._value
+
+    def unwrap_or_else(self, default: t.Callable[[], OkT]) -> OkT:
+        """Like `unwrap_or` but `default` is always called to get the value to return
+        if `Err`.
+
+        >>> Ok(5).unwrap_or_else(lambda: 10)
+        5
+
+        >>> Err("bad value").unwrap_or_else(lambda: 10)
+        10
+        """
+        return default()
 
     def map(self, func: t.Callable[[OkT], OutT]) -> Result[OutT, ErrT]:
         """Calls the `func` with the value wrapped in `Result` if `Ok`.
@@ -305,22 +450,36 @@ class Err(_ResultInternal[OkT, ErrT]):
         """
         return Err(self._value)
 
-    def map_or(
-        self, func: t.Callable[[OkT], OutT], *, default: OutT | t.Callable[[], OutT]
-    ) -> OutT:
+    def map_or(self, func: t.Callable[[OkT], OutT], *, default: OutT) -> OutT:
         """Calls the `func` with the value wrapped in `Result` if `Ok`
         returning the unwrapped value else return `default`.
 
+        Passing a callable as `default` is deprecated, use `map_or_else` instead.
+
         >>> Ok(5).map_or(lambda x: x + 1, default=10)
         6
 
         >>> Err("bad value").map_or(lambda x: x + 1, default=10)
         10
+        """
+        if callable(default):
+            _warn_callable_default("map_or", "map_or_else")
+            return t.cast("t.Callable[[], OutT]", default)()
+        return default
+
+    def map_or_else(
+        self, func: t.Callable[[OkT], OutT], *, default: t.Callable[[], OutT]
+    ) -> OutT:
+        """Like `map_or` but `default` is always called to get the value to return
+        if `Err`.
 
-        >>> Err("bad value").map_or(lambda x: x + 1, default=lambda: int("10"))
+        >>> Ok(5).map_or_else(lambda x: x + 1, default=lambda: 10)
+        6
+
+        >>> Err("bad value").map_or_else(lambda x: x + 1, default=lambda: 10)
         10
         """
-        return default() if callable(default) else default
+        return default()
 
     def map_err(self, func: t.Callable[[ErrT], OutT]) -> Result[OkT, OutT]:
         """Like `map` but acts on the value in `Err`.
@@ -361,21 +520,32 @@ class Err(_ResultInternal[OkT, ErrT]):
         """
         return Err(self._value)
 
-    def or_(
-        self, res: Result[OkT, ErrT] | t.Callable[[], Result[OkT, ErrT]]
-    ) -> Result[OkT, ErrT]:
+    def or_(self, res: Result[OkT, ErrT]) -> Result[OkT, ErrT]:
         """Return value if `Ok` otherwise returns `res`.
 
+        Passing a callable as `res` is deprecated, use `or_else` instead.
+
         >>> Ok(5).or_(Ok(6))
         Ok(5)
 
         >>> Err("bad value").or_(Ok(5))
         Ok(5)
+        """
+        if callable(res):
+            _warn_callable_default("or_", "or_else")
+            return t.cast("t.Callable[[], Result[OkT, ErrT]]", res)()
+        return res
 
-        >>> Err("bad value").or_(lambda: Ok(str(10)))
+    def or_else(self, func: t.Callable[[], Result[OkT, ErrT]]) -> Result[OkT, ErrT]:
+        """Like `or_` but `func` is called to get the `Result` to return if `Err`.
+
+        >>> Ok(5).or_else(lambda: Ok(6))
+        Ok(5)
+
+        >>> Err("bad value").or_else(lambda: Ok(str(10)))
         Ok('10')
         """
-        return res() if callable(res) else res
+        return func()
 
     def ok(self) -> maybe.Maybe[OkT]:
         """Converts `Result` to `Maybe`, keeping `Ok` value.
@@ -386,7 +556,7 @@ class Err(_ResultInternal[OkT, ErrT]):
         >>> Err("bad value").ok()
         Nothing()
         """
-        return maybe.Nothing()
+        return maybe._NOTHING
 
     def err(self) -> maybe.Maybe[ErrT]:
         """Converts `Result` to `Maybe`, keeping the `Err` value.
@@ -413,11 +583,13 @@ class Err(_ResultInternal[OkT, ErrT]):
         return err_func(self._value)
 
     def filter_or(
-        self, predicate: t.Callable[[OkT], bool], err: ErrT | t.Callable[[], ErrT]
+        self, predicate: t.Callable[[OkT], bool], err: ErrT
     ) -> Result[OkT, ErrT]:
         """Checks if the `Ok` value passes the `predicate`. If not returns an `Err`
         containing `err` value.
 
+        Passing a callable as `err` is deprecated, use `filter_or_else` instead.
+
         >>> Ok(5).filter_or(lambda x: x > 3, "lower than 3")
         Ok(5)
 
@@ -429,6 +601,23 @@ class Err(_ResultInternal[OkT, ErrT]):
         """
         return Err(self._value)
 
+    def filter_or_else(
+        self, predicate: t.Callable[[OkT], bool], err: t.Callable[[], ErrT]
+    ) -> Result[OkT, ErrT]:
+        """Like `filter_or` but `err` is called to get the value to put in the `Err`
+        if the `predicate` fails.
+
+        >>> Ok(5).filter_or_else(lambda x: x > 3, lambda: "lower than 3")
+        Ok(5)
+
+        >>> Ok(5).filter_or_else(lambda x: x > 7, lambda: "lower than 7")
+        Err('lower than 7')
+
+        >>> Err("bad value").filter_or_else(lambda x: x > 7, lambda: "lower than 7")
+        Err('bad value')
+        """
+        return Err(self._value)
+
     def is_ok(self) -> bool:
         """Checks if the value is `Ok`.
 
@@ -531,21 +720,23 @@ def result_wrapped(func: t.Callable[P, t.Any]) -> t.Callable[P, Result[t.Any, t.
 
     >>> safe_div(6, 0)
     Err('division by zero')
+
+    >>> result_wrapped(int)("x")
+    Err(ValueError("invalid literal for int() with base 10: 'x'"))
     """
 
-    @functools.wraps(func)
     def wrapper(*args: P.args, **kwargs: P.kwargs) -> Result[t.Any, t.Any]:
         try:
             res = func(*args, **kwargs)
             return (
-                t.cast(Ok[t.Any, t.Any] | Err[t.Any, t.Any], res)
-                if isinstance(res, Ok | Err)
+                t.cast("Result[t.Any, t.Any]", res)
+                if isinstance(res, _ResultInternal)
                 else Ok(res)
             )
         except Exception as exc:
             return Err(exc)
 
-    return wrapper
+    return fastwraps(func, wrapper)
 
 
 @t.overload
@@ -587,17 +778,24 @@ def result_wrapped_for(
     Traceback (most recent call last):
     ...
     ZeroDivisionError: division by zero
+
+    >>> import functools
+    >>> result_wrapped_for(ValueError)(functools.partial(int, base=2))("12")
+    Err(ValueError("invalid literal for int() with base 2: '12'"))
     """
 
+    if isinstance(excs_to_catch, tuple) and len(excs_to_catch) == 1:
+        # a bare class is matched faster than a tuple in the `except` clause
+        excs_to_catch = excs_to_catch[0]
+
     def decorator(func: t.Callable[P, OutT]) -> t.Callable[P, Result[OutT, Exception]]:
-        @functools.wraps(func)
         def wrapper(*args: P.args, **kwargs: P.kwargs) -> Result[OutT, Exception]:
             try:
                 return Ok(func(*args, **kwargs))
             except excs_to_catch as exc:
                 return Err(exc)
 
-        return wrapper
+        return fastwraps(func, wrapper)
 
     return decorator
 
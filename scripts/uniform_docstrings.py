@@ -1,7 +1,6 @@
 """Sets the same docstrings on several classes with the same methods."""
 
 import ast
-import typing as t
 
 # File name to the list of classes' names that need to have the same doctrings
 # in their methods.
@@ -12,58 +11,101 @@ TO_UNIFORMIZE = {
 }
 
 
-class ClassModifier(ast.NodeTransformer):
-    def __init__(
-        self, class_with_docstrings: ast.ClassDef, *args: t.Any, **kwargs: t.Any
-    ) -> None:
-        self._class_with_docstrings = class_with_docstrings
-        super().__init__(*args, **kwargs)
-
-    def function_with_docstring(self, function_name: str) -> ast.FunctionDef:
-        for child_node in ast.walk(self._class_with_docstrings):
-            if (
-                isinstance(child_node, ast.FunctionDef)
-                and child_node.name == function_name
-            ):
-                return child_node
-
-        raise RuntimeError(
-            f"Could not find function {function_name}"
-            f" in class {self._class_with_docstrings.name}"
-        )
-
-    def visit_FunctionDef(self, node: ast.FunctionDef) -> ast.FunctionDef:
-        with_docstring = self.function_with_docstring(node.name)
-        if not (docstring_content := ast.get_docstring(with_docstring, clean=False)):
-            return node
+class SourceEditor:
+    """Collects replacements of source ranges given by ast node positions and
+    applies them, leaving the rest of the source untouched.
+    """
 
-        docstring = ast.Expr(value=ast.Str(s=docstring_content))
+    def __init__(self, source: bytes) -> None:
+        self._source = source
+        self._line_offsets = [0]
+        for line in source.splitlines(keepends=True):
+            self._line_offsets.append(self._line_offsets[-1] + len(line))
+        self._edits: list[tuple[int, int, bytes]] = []
 
-        current_docstring = ast.get_docstring(node, clean=False)
-        if current_docstring:
-            node.body[0] = docstring
-        else:
-            node.body.insert(0, docstring)
+    def offset(self, lineno: int, col_offset: int) -> int:
+        # ast columns are utf-8 byte offsets, lines start at 1
+        return self._line_offsets[lineno - 1] + col_offset
 
-        return node
+    def segment(self, node: ast.expr | ast.stmt) -> bytes:
+        assert node.end_lineno is not None and node.end_col_offset is not None
+        return self._source[
+            self.offset(node.lineno, node.col_offset) : self.offset(
+                node.end_lineno, node.end_col_offset
+            )
+        ]
+
+    def replace(self, node: ast.expr | ast.stmt, text: bytes) -> None:
+        assert node.end_lineno is not None and node.end_col_offset is not None
+        self._edits.append(
+            (
+                self.offset(node.lineno, node.col_offset),
+                self.offset(node.end_lineno, node.end_col_offset),
+                text,
+            )
+        )
 
+    def insert_before(self, node: ast.expr | ast.stmt, text: bytes) -> None:
+        start = self.offset(node.lineno, node.col_offset)
+        self._edits.append((start, start, text))
+
+    def apply(self) -> bytes:
+        source = self._source
+        for start, end, text in sorted(self._edits, reverse=True):
+            source = source[:start] + text + source[end:]
+        return source
+
+
+def is_overload(node: ast.FunctionDef) -> bool:
+    for decorator in node.decorator_list:
+        if isinstance(decorator, ast.Attribute) and decorator.attr == "overload":
+            return True
+        if isinstance(decorator, ast.Name) and decorator.id == "overload":
+            return True
+    return False
+
+
+def methods(node: ast.ClassDef) -> dict[str, ast.FunctionDef]:
+    return {
+        child_node.name: child_node
+        for child_node in node.body
+        if isinstance(child_node, ast.FunctionDef) and not is_overload(child_node)
+    }
+
+
+def docstring_node(node: ast.FunctionDef) -> ast.Expr | None:
+    if (
+        node.body
+        and isinstance(first := node.body[0], ast.Expr)
+        and isinstance(first.value, ast.Constant)
+        and isinstance(first.value.value, str)
+    ):
+        return first
+    return None
+
+
+def uniformize_class(
+    editor: SourceEditor,
+    class_with_docstrings: ast.ClassDef,
+    class_to_modify: ast.ClassDef,
+) -> None:
+    with_docstrings = methods(class_with_docstrings)
+    for name, node in methods(class_to_modify).items():
+        if name not in with_docstrings:
+            raise RuntimeError(
+                f"Could not find function {name}"
+                f" in class {class_with_docstrings.name}"
+            )
 
-class DocstringAdder(ast.NodeTransformer):
-    def __init__(
-        self,
-        class_name: str,
-        class_modifier: ClassModifier,
-        *args: t.Any,
-        **kwargs: t.Any,
-    ) -> None:
-        self._class_name = class_name
-        self._class_modifier = class_modifier
-        super().__init__(*args, **kwargs)
+        if not (docstring := docstring_node(with_docstrings[name])):
+            continue
 
-    def visit_ClassDef(self, node: ast.ClassDef) -> ast.ClassDef:
-        if not node.name == self._class_name:
-            return node
-        return self._class_modifier.visit(node)
+        docstring_source = editor.segment(docstring)
+        if current_docstring := docstring_node(node):
+            editor.replace(current_docstring, docstring_source)
+        else:
+            indent = b" " * node.body[0].col_offset
+            editor.insert_before(node.body[0], docstring_source + b"\n" + indent)
 
 
 def find_class_def_by_name(
@@ -78,19 +120,23 @@ def find_class_def_by_name(
 
 def main() -> None:
     for file, classes in TO_UNIFORMIZE.items():
-        with open(file) as f:
-            tree = ast.parse(f.read())
+        with open(file, "rb") as f:
+            source = f.read()
 
-        class_with_docstrings = find_class_def_by_name(tree, classes[0], file)
+        tree = ast.parse(source)
+        editor = SourceEditor(source)
 
-        class_modifier = ClassModifier(class_with_docstrings)
+        class_with_docstrings = find_class_def_by_name(tree, classes[0], file)
         for class_name in classes[1:]:
-            tree = ast.fix_missing_locations(
-                DocstringAdder(class_name, class_modifier).visit(tree)
+            uniformize_class(
+                editor,
+                class_with_docstrings,
+                find_class_def_by_name(tree, class_name, file),
             )
 
-        with open(file, "w") as f:
-            f.write(ast.unparse(tree))
+        if (new_source := editor.apply()) != source:
+            with open(file, "wb") as f:
+                f.write(new_source)
 
 
 if __name__ == "__main__":
@@ -5,10 +5,18 @@ from gargle import maybe, result
 
 
 def _integrity_check(
-    classes: list[t.Any], ignore_type_integrity_check: list[str] = []
+    classes: list[type], ignore_type_integrity_check: list[str] = []
 ) -> None:
-    funcs = [dict(inspect.getmembers(c, predicate=inspect.isfunction)) for c in classes]
-    for f in funcs:
+    funcs: list[dict[str, t.Any]] = [
+        {name: func for name, func in vars(c).items() if inspect.isfunction(func)}
+        for c in classes
+    ]
+    type_hints = {
+        name: t.get_type_hints(func)
+        for name, func in funcs[0].items()
+        if name not in ignore_type_integrity_check
+    }
+    for f in funcs[1:]:
         assert f.keys() == funcs[0].keys(), f"{f.keys()} != {funcs[0].keys()}"
 
         for x in f:
@@ -17,7 +25,7 @@ def _integrity_check(
             if x in ignore_type_integrity_check:
                 continue
 
-            assert t.get_type_hints(funcs[0][x]) == t.get_type_hints(
+            assert type_hints[x] == t.get_type_hints(
                 f[x]
             ), f"Function `{f[x].__name__}`"
 
@@ -0,0 +1,40 @@
+import pytest
+
+from gargle.result import Err, Ok, Result
+
+
+class TestCallableDefaultDeprecation:
+    ok: Result[int, str] = Ok(5)
+    err: Result[int, str] = Err("bad value")
+
+    def test_unwrap_or(self):
+        with pytest.warns(DeprecationWarning, match="unwrap_or_else") as record:
+            assert self.err.unwrap_or(lambda: 10) == 10  # type: ignore
+
+        assert record[0].filename == __file__
+
+    def test_map_or(self):
+        with pytest.warns(DeprecationWarning, match="map_or_else") as record:
+            assert self.err.map_or(str, default=lambda: "10") == "10"
+
+        assert record[0].filename == __file__
+
+    def test_or(self):
+        with pytest.warns(DeprecationWarning, match="or_else") as record:
+            assert self.err.or_(lambda: Ok(10)) == Ok(10)  # type: ignore
+
+        assert record[0].filename == __file__
+
+    def test_filter_or(self):
+        with pytest.warns(DeprecationWarning, match="filter_or_else") as record:
+            res = self.ok.filter_or(lambda x: x > 7, lambda: "lower")  # type: ignore
+
+        assert res == Err("lower")
+        assert record[0].filename == __file__
+
+    def test_ok_does_not_call_default(self):
+        assert self.ok.unwrap_or(lambda: 10) == 5  # type: ignore
+        assert self.ok.map_or(str, default=lambda: "10") == "5"
+        assert self.ok.or_(lambda: Ok(10)) == Ok(5)  # type: ignore
+        res = self.ok.filter_or(lambda x: x > 3, lambda: "lower")  # type: ignore
+        assert res == Ok(5)
@@ -0,0 +1,68 @@
+import functools
+import inspect
+import typing as t
+
+import pytest
+
+from gargle.maybe import Some, maybe_wrapped, maybe_wrapped_cached
+from gargle.result import Err, Ok, result_wrapped, result_wrapped_for
+
+DECORATORS = [
+    maybe_wrapped,
+    maybe_wrapped_cached(),
+    result_wrapped,
+    result_wrapped_for(ValueError),
+]
+
+
+def optional_value(x: int) -> int | None:
+    return x
+
+
+optional_value.attr = "value"  # type: ignore
+
+
+class CallableInstance:
+    def __call__(self, x: int) -> int | None:
+        return x
+
+
+@pytest.mark.parametrize("decorator", DECORATORS)
+def test_wrapped_metadata(decorator: t.Callable[..., t.Any]) -> None:
+    wrapped = decorator(optional_value)
+
+    assert wrapped.__name__ == "optional_value"
+    assert inspect.unwrap(wrapped) is optional_value
+    assert t.get_type_hints(wrapped) == {"x": int, "return": int | None}
+    assert wrapped.attr == "value"
+
+
+@pytest.mark.parametrize("decorator", DECORATORS)
+@pytest.mark.parametrize(
+    ("func", "arg"),
+    [
+        (int, "1"),
+        (len, "a"),
+        (functools.partial(optional_value), 1),
+        (CallableInstance(), 1),
+    ],
+)
+def test_wrapped_any_callable(
+    decorator: t.Callable[..., t.Any], func: t.Callable[..., t.Any], arg: t.Any
+) -> None:
+    wrapped = decorator(func)
+
+    assert inspect.unwrap(wrapped) is func
+    assert wrapped(arg) in (Some(1), Ok(1))
+
+
+def test_result_wrapped_builtin_error() -> None:
+    assert isinstance(result_wrapped(int)("x"), Err)
+
+
+def test_maybe_wrapped_cached_builtin() -> None:
+    cached_len = maybe_wrapped_cached()(len)
+
+    assert cached_len("ab") == Some(2)
+    assert cached_len("ab") == Some(2)
+    assert cached_len.cache_info().hits == 1